@@ -1,32 +1,310 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Optional
+import asyncio
+import hashlib
+import json
+import logging
 import openai
 from datetime import datetime
-import os
+from redis.exceptions import RedisError
+
+from config import settings
+from agents.batcher import LLMBatcher
+from agents.errors import LLMOverloadedError
+
+logger = logging.getLogger(__name__)
+
+# Process-wide OpenAI client and request batcher, installed by the FastAPI lifespan
+_openai_client: Optional[openai.AsyncOpenAI] = None
+_batcher: Optional[LLMBatcher] = None
+
+# Bound on in-flight OpenAI calls per process, created on first use so it
+# belongs to the running event loop
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_llm_waiting = 0
+
+# Exact-match LLM response cache: a per-process LRU in front of an optional
+# Redis tier shared by all workers (installed by the FastAPI lifespan)
+_llm_cache: "OrderedDict[str, str]" = OrderedDict()
+_redis = None
+
+# Semantic and template caches, created on first use when enabled in settings
+_semantic_cache = None
+_gencache = None
+
+
+def set_openai_client(client: Optional[openai.AsyncOpenAI]) -> None:
+    """Install the OpenAI client shared by all agents"""
+    global _openai_client
+    _openai_client = client
+
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """Return the shared OpenAI client, creating a default one if none is installed"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _openai_client
+
+
+def set_llm_batcher(batcher: Optional[LLMBatcher]) -> None:
+    """Install the batcher used by agents relying on the shared client"""
+    global _batcher
+    _batcher = batcher
+
+
+def set_redis_client(client) -> None:
+    """Install the Redis client backing the shared LLM response cache"""
+    global _redis
+    _redis = client
+
+
+@asynccontextmanager
+async def _llm_slot():
+    """Hold one of MAX_CONCURRENT_LLM slots for an OpenAI call
+
+    Fails fast with LLMOverloadedError instead of queueing once
+    LLM_MAX_WAITERS callers are already waiting for a slot.
+    """
+    global _llm_semaphore, _llm_waiting
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+    if _llm_semaphore.locked() and _llm_waiting >= settings.LLM_MAX_WAITERS:
+        raise LLMOverloadedError("Too many concurrent LLM requests")
+
+    _llm_waiting += 1
+    try:
+        await _llm_semaphore.acquire()
+    finally:
+        _llm_waiting -= 1
+    try:
+        yield
+    finally:
+        _llm_semaphore.release()
+
+
+def _get_semantic_cache():
+    """Return the shared semantic cache, or None when it is disabled"""
+    global _semantic_cache
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+    if _semantic_cache is None:
+        from agents.semantic_cache import SemanticCache
+        _semantic_cache = SemanticCache(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_size=settings.SEMANTIC_CACHE_SIZE
+        )
+    return _semantic_cache
+
+
+def _get_gencache():
+    """Return the shared template cache, or None when it is disabled"""
+    global _gencache
+    if not settings.GENCACHE_ENABLED:
+        return None
+    if _gencache is None:
+        from agents.gencache import GenCache
+        _gencache = GenCache(
+            max_clusters=settings.GENCACHE_SIZE,
+            min_confirmations=settings.GENCACHE_MIN_CONFIRMATIONS,
+            verify_rate=settings.GENCACHE_VERIFY_RATE
+        )
+    return _gencache
+
+
+def _cache_key(model: str, messages: list, temperature: float) -> str:
+    """Build a deterministic cache key for a chat completion request"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _remember(key: str, content: str) -> None:
+    """Store a response in the in-process LRU cache"""
+    if settings.LLM_CACHE_SIZE <= 0:
+        return
+    _llm_cache[key] = content
+    _llm_cache.move_to_end(key)
+    if len(_llm_cache) > settings.LLM_CACHE_SIZE:
+        _llm_cache.popitem(last=False)
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    """Look a response up in the in-process cache, then in Redis"""
+    if key in _llm_cache:
+        _llm_cache.move_to_end(key)
+        return _llm_cache[key]
+    if _redis is None:
+        return None
+    try:
+        content = await _redis.get(f"llm:{key}")
+    except RedisError as e:
+        logger.warning("LLM cache lookup failed: %s", e)
+        return None
+    if content is not None:
+        _remember(key, content)
+    return content
+
+
+async def _cache_set(key: str, content: str) -> None:
+    """Store a response in the in-process cache and in Redis"""
+    _remember(key, content)
+    if _redis is None:
+        return
+    try:
+        await _redis.setex(f"llm:{key}", settings.LLM_CACHE_TTL, content)
+    except RedisError as e:
+        logger.warning("LLM cache store failed: %s", e)
+
 
 class BaseAgent(ABC):
-    """Base class for all AI agents"""
-    
-    def __init__(self, name: str):
+    """Base class for all AI agents
+
+    Subclasses should declare their own ``__slots__`` (``()`` when they add no
+    attributes) so instances stay free of a per-instance ``__dict__``.
+    """
+
+    __slots__ = ("name", "_client", "semantic_cache", "gencache")
+
+    # Optional static preamble sent as the first message of every call.
+    # OpenAI only caches prompt prefixes of 1024+ tokens, so a subclass that
+    # wants cache hits should set one at least that long. It must stay
+    # byte-identical across calls; never format per-request data into it -
+    # pass that as ``system_prompt`` instead. Empty by default so agents'
+    # conversations are unchanged.
+    BASE_SYSTEM_PROMPT = ""
+
+    def __init__(self, name: str, client: Optional[openai.AsyncOpenAI] = None):
         self.name = name
-        self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
+        self._client = client
+        self.semantic_cache = _get_semantic_cache()
+        self.gencache = _get_gencache()
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """OpenAI client for this agent, defaulting to the shared process-wide one"""
+        return self._client or get_openai_client()
+
     @abstractmethod
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process input and return results"""
         pass
-    
-    async def call_llm(self, prompt: str, system_prompt: str = None) -> str:
-        """Make a call to the LLM"""
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a synchronous call in a worker thread instead of blocking the event loop
+
+        Subclasses that need a sync SDK or CPU-heavy helper inside ``process``
+        should go through this rather than calling it inline.
+        """
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    def _build_messages(self, prompt: str, system_prompt: str = None) -> list:
+        """Build the chat messages: base preamble (if any), call-specific system prompt, user prompt"""
         messages = []
+        if self.BASE_SYSTEM_PROMPT:
+            messages.append({"role": "system", "content": self.BASE_SYSTEM_PROMPT})
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
-        
-        response = await self.client.chat.completions.create(
-            model="gpt-4o",
-            messages=messages,
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content
+        return messages
+
+    async def call_llm(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        temperature: float = 0.7,
+        cache: bool = False
+    ) -> str:
+        """Make a call to the LLM
+
+        Responses are cached when ``temperature`` is 0 (deterministic output),
+        or when the caller opts in with ``cache=True``. For those calls, when
+        the semantic cache is enabled, paraphrases of earlier prompts are also
+        served from cache; with GenCache enabled, prompts that differ from
+        earlier ones only in literal values get a response synthesized from a
+        learned template.
+        """
+        model = "gpt-4o"
+        messages = self._build_messages(prompt, system_prompt)
+
+        use_cache = temperature == 0 or cache
+        if use_cache:
+            key = _cache_key(model, messages, temperature)
+            cached = await _cache_get(key)
+            if cached is not None:
+                return cached
+
+        scope = f"{model}|{temperature}|{self.BASE_SYSTEM_PROMPT}|{system_prompt or ''}"
+        if use_cache and self.gencache is not None:
+            synthesized = self.gencache.lookup(scope, prompt)
+            if synthesized is not None:
+                return synthesized
+
+        # Paraphrase matches are looser than exact ones, so they get the same
+        # opt-in as the exact-match cache
+        if use_cache and self.semantic_cache is not None:
+            cached, vector = await self.semantic_cache.lookup(scope, prompt)
+            if cached is not None:
+                return cached
+
+        request = {"model": model, "messages": messages, "temperature": temperature}
+        async with _llm_slot():
+            if _batcher is not None and self._client is None:
+                pending = _batcher.submit(request, shareable=use_cache)
+            else:
+                pending = self.client.chat.completions.create(**request)
+            response = await asyncio.wait_for(pending, settings.LLM_TIMEOUT)
+        content = response.choices[0].message.content
+
+        details = getattr(response.usage, "prompt_tokens_details", None)
+        if details is not None:
+            logger.debug(
+                "%s: %s of %s prompt tokens served from OpenAI prompt cache",
+                self.name, details.cached_tokens, response.usage.prompt_tokens
+            )
+
+        if use_cache:
+            await _cache_set(key, content)
+
+        if use_cache and self.gencache is not None:
+            self.gencache.store(scope, prompt, content)
+
+        if use_cache and self.semantic_cache is not None:
+            self.semantic_cache.store(scope, vector, content)
+
+        return content
+
+    async def stream_llm(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """Stream LLM output as it is generated, yielding content deltas
+
+        Streams bypass the response caches and the batcher.
+        """
+        async with _llm_slot():
+            stream = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=self._build_messages(prompt, system_prompt),
+                    temperature=temperature,
+                    stream=True
+                ),
+                settings.LLM_TIMEOUT
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    def stream_process(self, input_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream the LLM output for a task; override to customize the prompt"""
+        prompt = input_data["task"]
+        if input_data.get("context"):
+            prompt += "\n\nContext:\n" + json.dumps(input_data["context"], default=str)
+        return self.stream_llm(prompt)
@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import openai
+
+
+class LLMBatcher:
+    """Coalesce concurrent chat completion requests into micro-batches
+
+    Requests submitted within ``max_wait`` seconds of each other (up to
+    ``batch_size`` of them) are dispatched together over the shared client's
+    connection pool. Identical requests in the same batch that were submitted
+    as ``shareable`` (deterministic, cacheable calls) are sent to OpenAI only
+    once and share the response; every other request gets its own call.
+    """
+
+    def __init__(
+        self,
+        client: openai.AsyncOpenAI,
+        max_wait: float = 0.02,
+        batch_size: int = 16
+    ):
+        self.client = client
+        self.max_wait = max_wait
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop"""
+        if self._worker is None:
+            self._stopping = False
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop batching, letting dispatched requests finish and failing queued ones"""
+        if self._worker is None:
+            return
+        self._stopping = True
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("LLM batcher stopped"))
+
+    async def submit(self, request: Dict[str, Any], shareable: bool = False) -> Any:
+        """Queue a chat completion request and wait for its response
+
+        ``shareable`` requests may be answered by an identical request's
+        response from the same batch.
+        """
+        if self._worker is None:
+            raise RuntimeError("LLM batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, shareable, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            try:
+                while len(batch) < self.batch_size and not self._stopping:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                # Before Python 3.12, wait_for swallows a cancel that races
+                # with a completed get(), so stop() also sets _stopping
+                if self._stopping:
+                    raise asyncio.CancelledError
+            except asyncio.CancelledError:
+                # Requests already taken off the queue would otherwise be lost
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("LLM batcher stopped"))
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self,
+        batch: List[Tuple[Dict[str, Any], bool, asyncio.Future]]
+    ) -> None:
+        groups: Dict[Any, Tuple[Dict[str, Any], List[asyncio.Future]]] = {}
+        for request, shareable, future in batch:
+            if shareable:
+                key = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+            else:
+                key = id(future)
+            groups.setdefault(key, (request, []))[1].append(future)
+
+        results = await asyncio.gather(
+            *(self.client.chat.completions.create(**request) for request, _ in groups.values()),
+            return_exceptions=True
+        )
+
+        for (_, futures), result in zip(groups.values(), results):
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -0,0 +1,3 @@
+class LLMOverloadedError(Exception):
+    """Raised when too many LLM calls are already waiting for a free slot"""
+    pass
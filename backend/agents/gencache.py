@@ -0,0 +1,119 @@
+import hashlib
+import random
+import re
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+# Literal values treated as variable slots in a prompt: quoted strings,
+# ISO dates/times, email addresses and numbers
+_SLOT_PATTERN = re.compile(
+    r'"([^"\n]+)"'
+    r"|\b\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2})?)?\b"
+    r"|[\w.+-]+@[\w-]+\.[\w.-]+"
+    r"|\b\d+(?:\.\d+)?\b"
+)
+_PLACEHOLDER_PATTERN = re.compile("\x00(\\d+)\x00")
+
+
+def extract_template(scope: str, prompt: str) -> Tuple[str, List[str]]:
+    """Split a prompt into (structural fingerprint, slot values)
+
+    ``scope`` (model, system prompt, ...) is part of the fingerprint verbatim;
+    only the prompt itself has its literals masked out.
+    """
+    slots = [m.group(1) or m.group(0) for m in _SLOT_PATTERN.finditer(prompt)]
+    normalized = _SLOT_PATTERN.sub("<SLOT>", prompt)
+    return hashlib.sha256(f"{scope}\x00{normalized}".encode()).hexdigest(), slots
+
+
+def _response_template(response: str, slots: List[str]) -> str:
+    """Replace occurrences of the prompt's slot values in a response with placeholders"""
+    index = {}
+    for i, value in enumerate(slots):
+        index.setdefault(value, i)
+    if not index:
+        return response
+    pattern = re.compile("|".join(_slot_regex(v) for v in sorted(index, key=len, reverse=True)))
+    return pattern.sub(lambda m: f"\x00{index[m.group(0)]}\x00", response)
+
+
+def _slot_regex(value: str) -> str:
+    """Regex matching a slot value only as a whole token (so "1" doesn't match in "10" or "1.5")"""
+    regex = re.escape(value)
+    if re.match(r"\w", value):
+        regex = r"(?<![\w.])" + regex
+    if re.search(r"\w$", value):
+        regex += r"(?!\w|\.\d)"
+    return regex
+
+
+class _Cluster:
+    __slots__ = ("template", "confirmations", "seen")
+
+    def __init__(self, template: str, slots: Tuple[str, ...]):
+        self.template = template
+        self.confirmations = 1
+        self.seen: Set[Tuple[str, ...]] = {slots}
+
+
+class GenCache:
+    """Template-based LLM response cache (GenCache)
+
+    Prompts are clustered by their structure with literal values masked out.
+    Each cluster stores the response with the prompt's slot values replaced by
+    placeholders. Once ``min_confirmations`` prompts with different slot values
+    have produced the same response template, new prompts in the cluster are
+    answered locally by filling the template with their own slot values.
+
+    Only templates that reference at least one slot are served, since a
+    constant response ("Yes") says nothing about how it depends on the
+    values. A ``verify_rate`` fraction of hits is passed through to the LLM
+    so a cluster whose responses stop matching its template gets reset.
+    """
+
+    def __init__(
+        self,
+        max_clusters: int = 1024,
+        min_confirmations: int = 5,
+        verify_rate: float = 0.1
+    ):
+        self.max_clusters = max_clusters
+        self.min_confirmations = min_confirmations
+        self.verify_rate = verify_rate
+        self._clusters: "OrderedDict[str, _Cluster]" = OrderedDict()
+
+    def lookup(self, scope: str, prompt: str) -> Optional[str]:
+        """Synthesize a response for a prompt from a confirmed cluster template"""
+        fingerprint, slots = extract_template(scope, prompt)
+        cluster = self._clusters.get(fingerprint)
+        if cluster is None or cluster.confirmations < self.min_confirmations:
+            return None
+        if _PLACEHOLDER_PATTERN.search(cluster.template) is None:
+            return None
+        if random.random() < self.verify_rate:
+            return None
+        self._clusters.move_to_end(fingerprint)
+        return _PLACEHOLDER_PATTERN.sub(lambda m: slots[int(m.group(1))], cluster.template)
+
+    def store(self, scope: str, prompt: str, response: str) -> None:
+        """Record an LLM response for a prompt in its structural cluster"""
+        fingerprint, slots = extract_template(scope, prompt)
+        if not slots:
+            return
+        template = _response_template(response, slots)
+        key = tuple(slots)
+
+        cluster = self._clusters.get(fingerprint)
+        if cluster is None:
+            self._clusters[fingerprint] = _Cluster(template, key)
+            if len(self._clusters) > self.max_clusters:
+                self._clusters.popitem(last=False)
+            return
+
+        self._clusters.move_to_end(fingerprint)
+        if cluster.template != template:
+            # The response depends on more than the slot values; start over
+            self._clusters[fingerprint] = _Cluster(template, key)
+        elif cluster.confirmations < self.min_confirmations and key not in cluster.seen:
+            cluster.seen.add(key)
+            cluster.confirmations += 1
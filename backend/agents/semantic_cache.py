@@ -0,0 +1,83 @@
+import asyncio
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, only needed when the cache is enabled
+    np = None
+
+
+class SemanticCache:
+    """Similarity-based LLM response cache
+
+    Prompts are embedded with a local sentence-transformers model and a cached
+    response is returned when a previously seen prompt in the same scope has a
+    cosine similarity at or above ``threshold``. Entries are evicted least
+    recently used first once ``max_size`` is reached.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.87,
+        max_size: int = 512,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        if np is None:
+            raise RuntimeError(
+                "numpy is required for the semantic cache; "
+                "pip install -r requirements-semantic-cache.txt"
+            )
+        self.threshold = threshold
+        self.max_size = max_size
+        self.model_name = model_name
+        self._model = None
+        self._embeddings = None
+        self._scope_ids = np.zeros(max_size, dtype=np.int64)
+        self._last_used = np.zeros(max_size, dtype=np.int64)
+        self._responses = [None] * max_size
+        self._size = 0
+        self._tick = 0
+
+    def _encode(self, text: str):
+        """Embed text as an L2-normalized vector"""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode([text], normalize_embeddings=True)[0]
+
+    async def lookup(self, scope: str, prompt: str) -> Tuple[Optional[str], "np.ndarray"]:
+        """Return (cached response or None, prompt embedding)
+
+        The embedding is returned so a miss can be stored without encoding
+        the prompt a second time.
+        """
+        vector = await asyncio.to_thread(self._encode, prompt)
+        if not self._size:
+            return None, vector
+
+        scores = self._embeddings[:self._size] @ vector
+        scores[self._scope_ids[:self._size] != hash(scope)] = -1.0
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None, vector
+
+        self._tick += 1
+        self._last_used[best] = self._tick
+        return self._responses[best], vector
+
+    def store(self, scope: str, vector: "np.ndarray", response: str) -> None:
+        """Add a response for an embedded prompt, evicting the LRU entry if full"""
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+
+        if self._size < self.max_size:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(self._last_used.argmin())
+
+        self._tick += 1
+        self._embeddings[slot] = vector
+        self._scope_ids[slot] = hash(scope)
+        self._last_used[slot] = self._tick
+        self._responses[slot] = response
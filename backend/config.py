@@ -1,12 +1,40 @@
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
 
-load_dotenv()
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings:
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-    DEBUG = os.getenv("DEBUG", "True").lower() == "true"
-    API_HOST = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT = int(os.getenv("API_PORT", "8000"))
+# Resolved from this file rather than the working directory, so the app finds
+# its .env however it is launched; backend/.env takes precedence over the
+# repository root's
+_BACKEND_DIR = Path(__file__).resolve().parent
+_ENV_FILES = (_BACKEND_DIR.parent / ".env", _BACKEND_DIR / ".env")
 
-settings = Settings()
+class Settings(BaseSettings):
+    OPENAI_API_KEY: str = ""
+    DEBUG: bool = True
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+    LLM_CACHE_SIZE: int = 1024
+    LLM_CACHE_TTL: int = 3600
+    REDIS_URL: str = ""
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.87
+    SEMANTIC_CACHE_SIZE: int = 512
+    GENCACHE_ENABLED: bool = False
+    GENCACHE_SIZE: int = 1024
+    GENCACHE_MIN_CONFIRMATIONS: int = 5
+    GENCACHE_VERIFY_RATE: float = 0.1
+    MAX_CONCURRENT_LLM: int = 32
+    LLM_MAX_WAITERS: int = 64
+    LLM_TIMEOUT: float = 30
+    LLM_BATCH_WAIT_MS: float = 20
+    LLM_BATCH_SIZE: int = 16
+
+    model_config = SettingsConfigDict(env_file=_ENV_FILES, extra="ignore", frozen=True)
+
+@lru_cache
+def get_settings() -> Settings:
+    """Parse and validate settings from the environment once per process"""
+    return Settings()
+
+settings = get_settings()
@@ -0,0 +1,13 @@
+import multiprocessing
+import os
+
+from config import settings
+
+# Production server settings: gunicorn managing uvicorn workers
+bind = f"{settings.API_HOST}:{settings.API_PORT}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 75
+# Import the app once in the master so workers fork with it already loaded;
+# per-worker state (OpenAI client, agents) is still created in the lifespan
+preload_app = True
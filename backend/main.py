@@ -1,17 +1,72 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any, List
+import asyncio
+import orjson
+import time
 import uvicorn
-from datetime import datetime
+from datetime import datetime, timezone
 
 from config import settings
-from agents.task_agent import TaskAgent
+from agents.errors import LLMOverloadedError
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients (OpenAI, batcher, Redis) on startup, close them on shutdown"""
+    # Imported here so the openai SDK and agent modules stay off the import
+    # path of the app module (and of the gunicorn master with preload_app)
+    import httpx
+    import openai
+    from agents.base_agent import set_llm_batcher, set_openai_client, set_redis_client
+    from agents.batcher import LLMBatcher
+    from agents.task_agent import TaskAgent
+
+    app.state.openai = openai.AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=75
+            )
+        )
+    )
+    set_openai_client(app.state.openai)
+    app.state.batcher = LLMBatcher(
+        app.state.openai,
+        max_wait=settings.LLM_BATCH_WAIT_MS / 1000,
+        batch_size=settings.LLM_BATCH_SIZE
+    )
+    app.state.batcher.start()
+    set_llm_batcher(app.state.batcher)
+    app.state.redis = None
+    if settings.REDIS_URL:
+        import redis.asyncio as aioredis
+        app.state.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        set_redis_client(app.state.redis)
+    # Agents are built per worker, after gunicorn forks, not at import time
+    app.state.task_agent = TaskAgent()
+    yield
+    if app.state.redis is not None:
+        set_redis_client(None)
+        await app.state.redis.aclose()
+    set_llm_batcher(None)
+    await app.state.batcher.stop()
+    set_openai_client(None)
+    await app.state.openai.close()
 
 app = FastAPI(
     title="AI-powered task management system",
     description="** AI-Task-Manager is an AI-powered task management system designed to help individuals and teams manage their tasks efficiently by leveraging machine learning to provide smart task prioritization and intelligent suggestions. The system integrates seamless real-time updates and insightful analytics to enhance productivity and streamline workflows.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -23,18 +78,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize agents
-task_agent = TaskAgent()
-
 class TaskRequest(BaseModel):
     task: str
     context: Dict[str, Any] = {}
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
 class TaskResponse(BaseModel):
     result: Dict[str, Any]
     timestamp: datetime
     processing_time: float
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
 @app.get("/")
 async def root():
     return {
@@ -46,27 +102,76 @@ async def root():
 @app.post("/api/process", response_model=TaskResponse)
 async def process_task(request: TaskRequest):
     """Process a task using AI agents"""
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
     
     try:
-        result = await task_agent.process({
+        result = await app.state.task_agent.process({
             "task": request.task,
             "context": request.context
         })
         
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
-        return TaskResponse(
+        # Server-built data; skip re-validating it on the way out
+        return TaskResponse.model_construct(
             result=result,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
             processing_time=processing_time
         )
+    except LLMOverloadedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="LLM request timed out")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/process/stream")
+async def process_task_stream(request: TaskRequest):
+    """Stream a task's LLM output as server-sent events"""
+    chunks = app.state.task_agent.stream_process({
+        "task": request.task,
+        "context": request.context
+    })
+
+    # Wait for the first chunk before sending headers so overload and
+    # timeouts still map to status codes instead of an SSE error event
+    try:
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except LLMOverloadedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="LLM request timed out")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events():
+        if first is None:
+            yield b"data: [DONE]\n\n"
+            return
+        yield b"data: " + orjson.dumps(first) + b"\n\n"
+        try:
+            async for chunk in chunks:
+                yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+        except Exception as e:
+            yield b"event: error\ndata: " + orjson.dumps(str(e)) + b"\n\n"
+            return
+        yield b"data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    # Liveness probes only need a 200; no per-call timestamp
+    return {"status": "healthy"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Local development only; production runs gunicorn with gunicorn_conf.py
+    uvicorn.run(
+        app,
+        host=settings.API_HOST,
+        port=settings.API_PORT,
+        loop="uvloop",
+        http="httptools"
+    )
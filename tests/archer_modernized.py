@@ -3,30 +3,145 @@ Modern Archer REST API Client for Python 3.10+
 Refactored with httpx, pydantic, async support, and proper type hints
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import logging
-from typing import Any, Optional
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 from pathlib import Path
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterable, Sequence
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
+    wait_exponential_jitter,
+    retry_if_exception,
     retry_if_exception_type,
 )
 
 from .user import User
 from .record import Record
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)-8s %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 log = logging.getLogger(__name__)
 
+# Raw bytes read per attachment chunk; a multiple of 3 so base64 output of
+# consecutive chunks concatenates without padding
+_ATTACHMENT_CHUNK_SIZE = 48 * 1024
+
+
+def _dumps(body: Any) -> bytes:
+    """Serialize a request body; field-content dicts are keyed by integer field IDs"""
+    return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _field_ids_prefix(field_ids: Sequence[int]) -> bytes:
+    """Serialize ``{"FieldIds": [...]`` once, leaving the object open for ContentIds"""
+    return orjson.dumps({"FieldIds": field_ids})[:-1]
+
+
+def _fieldcontent_body(prefix: bytes, content_ids: Sequence[int]) -> bytes:
+    """Complete a pre-serialized FieldIds prefix into a fieldcontent request body"""
+    return prefix + b',"ContentIds":' + orjson.dumps([_str_id(i) for i in content_ids]) + b"}"
+
+
+@lru_cache(maxsize=4096)
+def _str_id(content_id: int) -> str:
+    """Memoized string form of a content ID for repeated fetches of the same records"""
+    return str(content_id)
+
+
+# Transient transport failures on idempotent calls are retried with jittered
+# backoff so concurrent callers sharing the pool don't retry in lockstep
+_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.2, max=5),
+    retry=retry_if_exception_type((httpx.NetworkError, httpx.RemoteProtocolError)),
+    reraise=True
+)
+
+# Record-creating calls are only retried when the connection was never
+# established, so a request the server may have processed is not replayed
+_retry_connect = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.2, max=5),
+    retry=retry_if_exception_type(httpx.ConnectError),
+    reraise=True
+)
+
+
+def _fold_records(
+    records: list[dict[str, Any]],
+    key_field: str,
+    id_field: str,
+    prefix: str,
+    out: dict[str, int]
+) -> None:
+    """Add (prefix + key field value) -> ID entries for a page of GRC records
+
+    Kept as a self-contained function over plain lists and dicts so the
+    mapping build's only CPU-bound loop can be compiled if it ever shows up
+    in profiles.
+    """
+    intern = sys.intern
+    if prefix:
+        for record in records:
+            value = record.get(key_field)
+            if value is not None:
+                out[intern(prefix + str(value))] = record[id_field]
+    else:
+        for record in records:
+            value = record.get(key_field)
+            if value is not None:
+                out[intern(str(value))] = record[id_field]
+
+
+# GRC reads are throttled by the server under parallel pagination; rate
+# limiting and transient server errors are retried, honouring Retry-After
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_GRC_MAX_WAIT = 30
+_grc_backoff = wait_exponential(multiplier=0.5, max=_GRC_MAX_WAIT)
+
+
+def _is_retryable_grc_error(exc: BaseException) -> bool:
+    """Retry transport failures and rate-limit/server-error responses"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+def _grc_wait(retry_state) -> float:
+    """Wait as long as the server's Retry-After asks (capped), else back off exponentially"""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), _GRC_MAX_WAIT)
+            except ValueError:  # HTTP-date form
+                pass
+    return _grc_backoff(retry_state)
+
+
+_retry_grc = retry(
+    stop=stop_after_attempt(6),
+    wait=_grc_wait,
+    retry=retry_if_exception(_is_retryable_grc_error),
+    reraise=True
+)
+
+# Responses meaning the endpoint can't answer $count (as opposed to failing)
+_COUNT_UNSUPPORTED_STATUS = frozenset({400, 404, 501})
+
 
 # Custom Exceptions
 class ArcherAPIError(Exception):
@@ -102,6 +217,14 @@ class FieldDefinition(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class _MetadataEntry(NamedTuple):
+    """Cached metadata response with its HTTP validators"""
+    etag: str | None
+    last_modified: str | None
+    data: Any
+    expires_at: float
+
+
 class ArcherInstance:
     """
     Modern Archer instance client with async support.
@@ -115,8 +238,31 @@ class ArcherInstance:
         ssl_verify: Enable SSL verification (default: True)
         ca_cert_path: Path to custom CA certificate
         timeout: Request timeout in seconds (default: 30.0)
+        connect_timeout: Connection timeout in seconds (default: 5.0)
+        max_connections: Connection pool size shared by all requests,
+            including concurrent GRC page fetches (default: 100)
+        max_keepalive_connections: Idle connections kept open for reuse
+            (default: 50)
+        metadata_ttl: Seconds to reuse application/group metadata without
+            revalidating it (default: 60.0)
+        cache_dir: Directory to persist metadata validators and unique-value
+            mappings across runs (e.g. ~/.cache/archer); disabled when None
+        mapping_ttl: Seconds a persisted unique-value mapping is reused
+            before it is rebuilt from the GRC API (default: 3600.0)
+        grc_concurrency: Maximum GRC API requests in flight across the
+            instance (default: 16)
     """
 
+    _BASE_HEADERS = {
+        "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Content-Type": "application/json",
+    }
+
+    # Per-call method overrides; merged by httpx with the client's headers
+    _OVERRIDE_PUT = {"X-Http-Method-Override": "PUT"}
+    _OVERRIDE_POST = {"X-Http-Method-Override": "POST"}
+    _OVERRIDE_DELETE = {"X-Http-Method-Override": "DELETE"}
+
     def __init__(
         self,
         inst_url: str,
@@ -127,25 +273,51 @@ class ArcherInstance:
         ssl_verify: bool = True,
         ca_cert_path: Path | str | None = None,
         timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        metadata_ttl: float = 60.0,
+        cache_dir: Path | str | None = None,
+        mapping_ttl: float = 3600.0,
+        grc_concurrency: int = 16,
     ):
         self.api_url_base = f"https://{inst_url}/RSAarcher/api/"
         self.content_api_url_base = f"https://{inst_url}/RSAarcher/contentapi/"
+
+        # Endpoint URL prefixes, joined once rather than on every call
+        self._url_login = self.api_url_base + "core/security/login"
+        self._url_user = self.api_url_base + "core/system/user/"
+        self._url_group = self.api_url_base + "core/system/group/"
+        self._url_application = self.api_url_base + "core/system/application/"
+        self._url_fielddefinition = self.api_url_base + "core/system/fielddefinition/application/"
+        self._url_valueslist = self.api_url_base + "core/system/valueslistvalue/flat/valueslist/"
+        self._url_content = self.api_url_base + "core/content/"
+        self._url_attachment = self.api_url_base + "core/content/attachment"
+        self._url_fieldcontent = self.api_url_base + "core/content/fieldcontent/"
         self.instance_name = instance_name
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30,
+        )
 
         # SSL Configuration
         ca_path = Path(ca_cert_path) if ca_cert_path else None
-        self.ssl_config = SSLConfig(verify=ssl_verify, ca_cert_path=ca_path)
+        # Built from constructor arguments, so skip pydantic validation
+        self.ssl_config = SSLConfig.model_construct(verify=ssl_verify, ca_cert_path=ca_path)
 
         # Authentication
         self._credentials: AuthCredentials | None = None
         self._session_token: str | None = session_token
 
         if username and password:
-            self._credentials = AuthCredentials(
+            self._credentials = AuthCredentials.model_construct(
                 instance_name=instance_name,
                 username=username,
-                password=password
+                password=password,
+                user_domain=""
             )
         elif not session_token:
             raise ValueError("Either username/password or session_token must be provided")
@@ -153,14 +325,30 @@ class ArcherInstance:
         # HTTP Client (created lazily)
         self._client: httpx.AsyncClient | None = None
 
+        # Metadata cache (application, field and group definitions)
+        self.metadata_ttl = metadata_ttl
+        self.cache_dir = Path(cache_dir).expanduser() / instance_name if cache_dir else None
+        self._metadata_cache: dict[str, _MetadataEntry] = {}
+        self.mapping_ttl = mapping_ttl
+        # prefix -> (path, mapping, built_at) of the last persisted mapping
+        # built with that prefix, so records added later can be written back
+        self._mapping_files: dict[str, tuple[Path, dict[str, int], float]] = {}
+        self._dirty_mappings: set[str] = set()
+        self._grc_semaphore = asyncio.Semaphore(grc_concurrency)
+
         # Application state
         self.application_level_id: str = ""
         self.application_fields_json: dict[str | int, Any] = {}
-        self.all_application_fields_array: list[int] = []
+        self.all_application_fields_array: tuple[int, ...] = ()
+        self._field_ids_prefix: bytes = b""
         self.vl_name_to_vl_id: dict[str, int] = {}
         self.subforms_json_by_sf_name: dict[str, dict[str, Any]] = {}
+        self._field_types: dict[int, int] = {}
+        self._subform_field_types: dict[str, dict[int, int]] = {}
+        self._subform_field_ids_prefix: dict[str, bytes] = {}
         self.key_field_value_to_system_id: dict[str, int] = {}
         self.archer_groups_name_to_id: dict[str, int] = {}
+        self._group_names: tuple[str, ...] = ()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -173,30 +361,183 @@ class ArcherInstance:
         """Async context manager exit"""
         await self.close()
 
-    async def _ensure_client(self) -> None:
-        """Ensure HTTP client is initialized"""
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        Ensure HTTP client is initialized and return it.
+
+        Call sites use ``self._client or await self._ensure_client()`` so that
+        once the client exists no coroutine is created per request.
+        """
         if self._client is None:
             self._client = httpx.AsyncClient(
                 verify=self.ssl_config.get_verify_param(),
-                timeout=self.timeout,
+                timeout=httpx.Timeout(
+                    connect=self.connect_timeout,
+                    read=self.timeout,
+                    write=self.timeout,
+                    pool=self.timeout,
+                ),
+                limits=self.limits,
+                http2=True,
+                headers=self._BASE_HEADERS,
             )
+            if self._session_token:
+                self._client.headers["Authorization"] = f"Archer session-id={self._session_token}"
+        return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client"""
+        """Persist added mapping records and close the HTTP client"""
+        self._flush_mappings()
         if self._client:
             await self._client.aclose()
             self._client = None
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Get headers for API requests"""
-        headers = {
-            "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Content-Type": "application/json",
-        }
-        if self._session_token:
-            headers["Authorization"] = f"Archer session-id={self._session_token}"
-        return headers
+    def _set_session_token(self, token: str) -> None:
+        """Store the session token and attach it to the HTTP client"""
+        self._session_token = token
+        if self._client is not None:
+            self._client.headers["Authorization"] = f"Archer session-id={token}"
+
+    def _metadata_path(self, api_url: str) -> Path | None:
+        """Get the on-disk location for a cached metadata URL"""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(api_url.encode()).hexdigest()}.json"
+
+    def _load_metadata(self, api_url: str) -> _MetadataEntry | None:
+        """Load persisted metadata; it must be revalidated before use"""
+        path = self._metadata_path(api_url)
+        if path is None or not path.exists():
+            return None
+        try:
+            stored = json.loads(path.read_text())
+            return _MetadataEntry(stored["etag"], stored["last_modified"], stored["data"], 0.0)
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("Ignoring unreadable metadata cache %s: %s", path, e)
+            return None
+
+    def _save_metadata(self, api_url: str, entry: _MetadataEntry) -> None:
+        """Persist metadata with validators so a later run can revalidate it"""
+        path = self._metadata_path(api_url)
+        if path is None or not (entry.etag or entry.last_modified):
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "data": entry.data,
+            }))
+        except OSError as e:
+            log.warning("Could not write metadata cache %s: %s", path, e)
+
+    def _mapping_path(self, *key: Any) -> Path | None:
+        """Get the on-disk location for a persisted unique-value mapping"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1("|".join(map(str, key)).encode()).hexdigest()
+        return self.cache_dir / f"mapping-{digest}.json"
+
+    def _load_mapping(self, path: Path | None, prefix: str) -> dict[str, int] | None:
+        """Load a persisted mapping if it is younger than mapping_ttl"""
+        if path is None:
+            return None
+        try:
+            built_at = path.stat().st_mtime
+            if time.time() - built_at >= self.mapping_ttl:
+                return None
+            mapping = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            log.warning("Ignoring unreadable mapping cache %s: %s", path, e)
+            return None
+        self._mapping_files[prefix] = (path, mapping, built_at)
+        return mapping
+
+    def _save_mapping(self, path: Path | None, mapping: dict[str, int], prefix: str) -> None:
+        """Persist a freshly built mapping for later runs"""
+        if path is None:
+            return
+        built_at = time.time()
+        if self._write_mapping(path, mapping, built_at):
+            self._mapping_files[prefix] = (path, mapping, built_at)
+
+    def _write_mapping(self, path: Path, mapping: dict[str, int], built_at: float) -> bool:
+        """Write a mapping file, dating it from when its contents were fetched"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(orjson.dumps(mapping))
+            # Write-backs of added records must not extend mapping_ttl
+            os.utime(path, (built_at, built_at))
+        except OSError as e:
+            log.warning("Could not write mapping cache %s: %s", path, e)
+            return False
+        return True
+
+    def _track_added_records(self, added: dict[str, int], prefix: str) -> None:
+        """Add records to the persisted mapping built with the same prefix"""
+        entry = self._mapping_files.get(prefix)
+        if entry is not None:
+            entry[1].update(added)
+            self._dirty_mappings.add(prefix)
+
+    def _flush_mappings(self) -> None:
+        """Re-save persisted mappings that records were added to since they were built"""
+        while self._dirty_mappings:
+            path, mapping, built_at = self._mapping_files[self._dirty_mappings.pop()]
+            self._write_mapping(path, mapping, built_at)
+
+    @_retry
+    async def _get_metadata(self, api_url: str, method: str = "GET") -> Any:
+        """
+        Fetch slow-changing metadata with an expiry window and conditional requests.
+
+        Within metadata_ttl the cached body is returned without a request.
+        After that, GET requests send the ETag/Last-Modified validators and a
+        304 response reuses the cached body. Other methods can't be
+        revalidated (a failed precondition is answered with 412, not 304),
+        so they are only cached for metadata_ttl and never persisted.
+
+        Args:
+            api_url: Metadata URL
+            method: HTTP method the endpoint expects
+
+        Returns:
+            Decoded JSON response
+        """
+        client = self._client or await self._ensure_client()
+        conditional = method == "GET"
+        entry = self._metadata_cache.get(api_url)
+        if entry is None and conditional:
+            entry = self._load_metadata(api_url)
+        now = time.monotonic()
+        if entry is not None and entry.expires_at > now:
+            return entry.data
+
+        headers = {}
+        if entry is not None and conditional:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await client.request(method, api_url, headers=headers)
+        if response.status_code == 304 and entry is not None and conditional:
+            entry = entry._replace(expires_at=now + self.metadata_ttl)
+        else:
+            response.raise_for_status()
+            entry = _MetadataEntry(
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                orjson.loads(response.content),
+                now + self.metadata_ttl,
+            )
+            if conditional:
+                self._save_metadata(api_url, entry)
+
+        self._metadata_cache[api_url] = entry
+        return entry.data
 
     @retry(
         stop=stop_after_attempt(3),
@@ -217,39 +558,34 @@ class ArcherInstance:
         if not self._credentials:
             raise AuthenticationError("No credentials provided for token acquisition")
 
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/security/login"
-        
-        headers = {
-            "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Content-Type": "application/json"
-        }
+        client = self._client or await self._ensure_client()
+        api_url = self._url_login
 
         try:
-            response = await self._client.post(
+            response = await client.post(
                 api_url,
-                headers=headers,
-                json={
+                content=_dumps({
                     "InstanceName": self._credentials.instance_name,
                     "Username": self._credentials.username,
                     "UserDomain": self._credentials.user_domain,
                     "Password": self._credentials.password,
-                }
+                })
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            self._session_token = data["RequestedObject"]["SessionToken"]
+            self._set_session_token(data["RequestedObject"]["SessionToken"])
             log.info("Successfully acquired session token")
             return self._session_token
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Authentication failed: {e}")
+            log.error("Authentication failed: %s", e)
             raise AuthenticationError(f"Failed to acquire session token: {e}") from e
         except (KeyError, TypeError) as e:
-            log.error(f"Invalid response format: {e}")
+            log.error("Invalid response format: %s", e)
             raise AuthenticationError("Invalid authentication response format") from e
 
+    @_retry
     async def get_users(self, params: str = "") -> list[User]:
         """
         Get users from Archer.
@@ -261,18 +597,18 @@ class ArcherInstance:
         Returns:
             List of User objects
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/system/user/{params}"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_user + params
 
         try:
-            response = await self._client.post(api_url, headers=self._headers)
+            response = await client.post(api_url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return [User(self, user) for user in data]
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get users: {e}")
+            log.error("Failed to get users: %s", e)
             raise ArcherAPIError(f"Failed to retrieve users: {e}") from e
 
     async def get_all_groups(self) -> dict[str, int]:
@@ -282,24 +618,22 @@ class ArcherInstance:
         Returns:
             Dictionary mapping group names to IDs
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/system/group/"
+        api_url = self._url_group
 
         try:
-            response = await self._client.post(api_url, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_metadata(api_url, method="POST")
 
             self.archer_groups_name_to_id = {
                 group["RequestedObject"]["Name"]: group["RequestedObject"]["Id"]
                 for group in data
             }
-            
-            log.info(f"Downloaded {len(self.archer_groups_name_to_id)} groups")
+            self._group_names = tuple(self.archer_groups_name_to_id)
+
+            log.info("Downloaded %d groups", len(self.archer_groups_name_to_id))
             return self.archer_groups_name_to_id
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get groups: {e}")
+            log.error("Failed to get groups: %s", e)
             raise ArcherAPIError(f"Failed to retrieve groups: {e}") from e
 
     def find_group(self, name: str) -> list[str]:
@@ -316,23 +650,43 @@ class ArcherInstance:
             GroupNotFoundError: If no matching groups found
         """
         if not name:
-            return list(self.archer_groups_name_to_id.keys())
+            return list(self._group_names)
 
-        matches = [
-            group_name 
-            for group_name in self.archer_groups_name_to_id 
-            if name in group_name
-        ]
+        matches = [group_name for group_name in self._group_names if name in group_name]
 
         if not matches:
-            log.warning(f"No groups found matching '{name}'")
+            log.warning("No groups found matching '%s'", name)
             raise GroupNotFoundError(
                 f"No groups found matching '{name}'. "
-                f"Available groups: {', '.join(self.archer_groups_name_to_id.keys())}"
+                f"Available groups: {', '.join(self._group_names)}"
             )
 
         return matches
 
+    def find_first_group(self, name: str) -> str:
+        """
+        Find the first group matching the given name.
+
+        Stops at the first match instead of scanning every group.
+
+        Args:
+            name: Group name or partial name to search for
+
+        Returns:
+            First matching group name
+
+        Raises:
+            GroupNotFoundError: If no matching groups found
+        """
+        match = next((group_name for group_name in self._group_names if name in group_name), None)
+        if match is None:
+            log.warning("No groups found matching '%s'", name)
+            raise GroupNotFoundError(
+                f"No groups found matching '{name}'. "
+                f"Available groups: {', '.join(self._group_names)}"
+            )
+        return match
+
     def get_group_id(self, group_name: str) -> int:
         """
         Get group ID by name.
@@ -346,14 +700,14 @@ class ArcherInstance:
         Raises:
             GroupNotFoundError: If group not found
         """
-        if group_name not in self.archer_groups_name_to_id:
-            available = ', '.join(self.archer_groups_name_to_id.keys())
+        group_id = self.archer_groups_name_to_id.get(group_name)
+        if group_id is None:
             raise GroupNotFoundError(
-                f"Group '{group_name}' not found. Available: {available}"
+                f"Group '{group_name}' not found. Available: {', '.join(self._group_names)}"
             )
-        
-        return self.archer_groups_name_to_id[group_name]
+        return group_id
 
+    @_retry
     async def get_user_by_id(self, user_id: int) -> User:
         """
         Get user by ID.
@@ -364,18 +718,18 @@ class ArcherInstance:
         Returns:
             User object
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/system/user/{user_id}"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_user + str(user_id)
 
         try:
-            response = await self._client.post(api_url, headers=self._headers)
+            response = await client.post(api_url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return User(self, data)
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get user {user_id}: {e}")
+            log.error("Failed to get user %s: %s", user_id, e)
             raise ArcherAPIError(f"Failed to retrieve user {user_id}: {e}") from e
 
     async def get_active_users_with_no_login(self) -> list[User]:
@@ -403,19 +757,16 @@ class ArcherInstance:
         Raises:
             ApplicationNotFoundError: If application not found
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/system/application/"
+        api_url = self._url_application
 
         try:
-            response = await self._client.get(api_url, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_metadata(api_url)
 
             for application in data:
                 if application["RequestedObject"]["Name"] == app_name:
                     application_id = application["RequestedObject"]["Id"]
                     await self.get_application_fields(application_id)
-                    log.info(f"Loaded application: {app_name}")
+                    log.info("Loaded application: %s", app_name)
                     return self
 
             # Application not found
@@ -425,7 +776,7 @@ class ArcherInstance:
             )
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to load application: {e}")
+            log.error("Failed to load application: %s", e)
             raise ArcherAPIError(f"Failed to load application: {e}") from e
 
     async def get_application_fields(self, application_id: int) -> None:
@@ -435,17 +786,13 @@ class ArcherInstance:
         Args:
             application_id: Internal Archer application ID
         """
-        await self._ensure_client()
-        api_url = (
-            f"{self.api_url_base}core/system/fielddefinition/application/"
-            f"{application_id}?$filter=IsActive eq true"
-        )
+        api_url = f"{self._url_fielddefinition}{application_id}?$filter=IsActive eq true"
 
         try:
-            response = await self._client.get(api_url, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_metadata(api_url)
 
+            field_ids: list[int] = []
+            subforms: list[tuple[str, int]] = []
             for field in data:
                 req_obj = field["RequestedObject"]
                 name = req_obj["Name"]
@@ -453,27 +800,44 @@ class ArcherInstance:
                 level_id = req_obj["LevelId"]
                 field_type = req_obj["Type"]
 
-                self.all_application_fields_array.append(field_id)
+                field_ids.append(field_id)
                 self.application_fields_json[name] = field_id
                 self.application_fields_json[field_id] = {
                     "Type": field_type,
                     "FieldId": field_id
                 }
+                self._field_types[field_id] = field_type
 
                 match field_type:
                     case 4:  # Values list
                         self.vl_name_to_vl_id[name] = req_obj["RelatedValuesListId"]
                     case 24:  # Subform
-                        subform_id = req_obj["RelatedSubformId"]
-                        subform_fields, all_fields = await self.get_subform_fields_by_id(subform_id)
-                        self.subforms_json_by_sf_name[name] = subform_fields
-                        self.subforms_json_by_sf_name[name]["AllFields"] = all_fields
+                        subforms.append((name, req_obj["RelatedSubformId"]))
+
+            # Subform definitions are independent requests; fetch them concurrently
+            results = await asyncio.gather(
+                *(self.get_subform_fields_by_id(subform_id) for _, subform_id in subforms)
+            )
+            for (name, _), (subform_fields, all_fields) in zip(subforms, results):
+                self.subforms_json_by_sf_name[name] = subform_fields
+                self.subforms_json_by_sf_name[name]["AllFields"] = all_fields
+                self._subform_field_types[name] = {
+                    field_id: field_def["Type"]
+                    for field_id, field_def in subform_fields.items()
+                    if isinstance(field_def, dict)
+                }
+                self._subform_field_ids_prefix[name] = _field_ids_prefix(all_fields)
 
+            # Read-only from here on
+            self.all_application_fields_array = (*self.all_application_fields_array, *field_ids)
             self.application_level_id = str(level_id)
-            log.info(f"Loaded {len(self.all_application_fields_array)} fields")
+            # FieldIds is identical for every record fetch; serialize it once
+            # per application load
+            self._field_ids_prefix = _field_ids_prefix(self.all_application_fields_array)
+            log.info("Loaded %d fields", len(self.all_application_fields_array))
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get application fields: {e}")
+            log.error("Failed to get application fields: %s", e)
             raise ArcherAPIError(f"Failed to retrieve application fields: {e}") from e
 
     async def get_subform_fields_by_id(
@@ -489,16 +853,10 @@ class ArcherInstance:
         Returns:
             Tuple of (field definitions dict, list of field IDs)
         """
-        await self._ensure_client()
-        api_url = (
-            f"{self.api_url_base}core/system/fielddefinition/application/"
-            f"{subform_id}?$filter=IsActive eq true"
-        )
+        api_url = f"{self._url_fielddefinition}{subform_id}?$filter=IsActive eq true"
 
         try:
-            response = await self._client.get(api_url, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_metadata(api_url)
 
             subform_fields = {}
             field_ids = []
@@ -521,7 +879,7 @@ class ArcherInstance:
             return subform_fields, field_ids
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get subform fields: {e}")
+            log.error("Failed to get subform fields: %s", e)
             raise ArcherAPIError(f"Failed to retrieve subform fields: {e}") from e
 
     def get_vl_id_by_field_name(self, vl_field_name: str) -> int:
@@ -537,10 +895,12 @@ class ArcherInstance:
         Raises:
             FieldNotFoundError: If field not found
         """
-        if vl_field_name not in self.vl_name_to_vl_id:
+        vl_id = self.vl_name_to_vl_id.get(vl_field_name)
+        if vl_id is None:
             raise FieldNotFoundError(f"Values list field '{vl_field_name}' not found")
-        return self.vl_name_to_vl_id[vl_field_name]
+        return vl_id
 
+    @_retry
     async def get_value_id_by_field_name_and_value(
         self, 
         field_name: str, 
@@ -560,16 +920,13 @@ class ArcherInstance:
             FieldNotFoundError: If value not found
         """
         values_list_id = self.get_vl_id_by_field_name(field_name)
-        await self._ensure_client()
-        api_url = (
-            f"{self.api_url_base}core/system/valueslistvalue/flat/valueslist/"
-            f"{values_list_id}"
-        )
+        client = self._client or await self._ensure_client()
+        api_url = self._url_valueslist + str(values_list_id)
 
         try:
-            response = await self._client.get(api_url, headers=self._headers)
+            response = await client.get(api_url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             for ind_value in data:
                 if ind_value["RequestedObject"]["Name"] == value:
@@ -580,7 +937,7 @@ class ArcherInstance:
             )
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get value ID: {e}")
+            log.error("Failed to get value ID: %s", e)
             raise ArcherAPIError(f"Failed to retrieve value ID: {e}") from e
 
     def get_field_id_by_name(
@@ -601,13 +958,16 @@ class ArcherInstance:
         Raises:
             FieldNotFoundError: If field not found
         """
-        try:
-            if subform_name:
-                return self.subforms_json_by_sf_name[subform_name][field_name]
-            return self.application_fields_json[field_name]
-        except KeyError:
+        if subform_name:
+            mapping = self.subforms_json_by_sf_name.get(subform_name, {})
+        else:
+            mapping = self.application_fields_json
+
+        field_id = mapping.get(field_name)
+        if field_id is None:
             location = f"subform '{subform_name}'" if subform_name else "application"
             raise FieldNotFoundError(f"Field '{field_name}' not found in {location}")
+        return field_id
 
     def _prepare_field_value(self, field_id: int, value_content: Any) -> dict[str, Any]:
         """
@@ -620,10 +980,13 @@ class ArcherInstance:
         Returns:
             Field definition with value
         """
-        field_def = dict(self.application_fields_json[field_id])
-        field_def["Value"] = value_content
-        return field_def
+        return {
+            "Type": self._field_types[field_id],
+            "FieldId": field_id,
+            "Value": value_content,
+        }
 
+    @_retry_connect
     async def create_content_record(
         self,
         fields_json: dict[str, Any],
@@ -639,20 +1002,21 @@ class ArcherInstance:
         Returns:
             Record ID (created or updated)
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_content
 
         # Transform field names to IDs
+        application_fields = self.application_fields_json
         transformed_json = {}
         for field_name, value in fields_json.items():
-            field_id = self.get_field_id_by_name(field_name)
+            field_id = application_fields.get(field_name)
+            if field_id is None:
+                raise FieldNotFoundError(f"Field '{field_name}' not found in application")
             transformed_json[field_id] = self._prepare_field_value(field_id, value)
 
         # Prepare request
-        headers = dict(self._headers)
-        
         if record_id:
-            headers["X-Http-Method-Override"] = "PUT"
+            headers = self._OVERRIDE_PUT
             body = {
                 "Content": {
                     "Id": record_id,
@@ -660,36 +1024,60 @@ class ArcherInstance:
                     "FieldContents": transformed_json
                 }
             }
-            method = "put"
+            request_fn = client.put
             action = "updated"
         else:
-            headers["X-Http-Method-Override"] = "POST"
+            headers = self._OVERRIDE_POST
             body = {
                 "Content": {
                     "LevelId": self.application_level_id,
                     "FieldContents": transformed_json
                 }
             }
-            method = "post"
+            request_fn = client.post
             action = "created"
 
         try:
-            response = await getattr(self._client, method)(
-                api_url,
-                headers=headers,
-                json=body
-            )
+            response = await request_fn(api_url, headers=headers, content=_dumps(body))
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             result_id = data["RequestedObject"]["Id"]
-            log.info(f"Record {action}: {result_id}")
+            log.info("Record %s: %s", action, result_id)
             return result_id
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to {action.rstrip('d')} record: {e}")
+            log.error("Failed to %s record: %s", action.rstrip('d'), e)
             raise ArcherAPIError(f"Failed to {action.rstrip('d')} record: {e}") from e
 
+    async def create_content_records(
+        self,
+        rows: Sequence[dict[str, Any]],
+        concurrency: int = 16
+    ) -> list[int | BaseException]:
+        """
+        Create multiple content records concurrently.
+        
+        Up to concurrency requests are in flight at once over the shared
+        connection pool. A failed row does not stop the others.
+        
+        Args:
+            rows: Dicts mapping field names to values, one per record
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Created record IDs in input order, with the raised exception in
+            place of the ID for rows that failed
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(row: dict[str, Any]) -> int:
+            async with semaphore:
+                return await self.create_content_record(row)
+
+        return await asyncio.gather(*(create(row) for row in rows), return_exceptions=True)
+
+    @_retry_connect
     async def create_sub_record(
         self,
         fields_json: dict[str, Any],
@@ -705,22 +1093,23 @@ class ArcherInstance:
         Returns:
             Subrecord ID
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_content
 
         subform_field_id = self.get_field_id_by_name(subform_name)
         subform_level_id = self.subforms_json_by_sf_name[subform_name]["LevelId"]
 
         # Transform field names to IDs
+        subform_fields = self.subforms_json_by_sf_name[subform_name]
+        field_types = self._subform_field_types[subform_name]
         transformed_json = {}
         for field_name, value in fields_json.items():
-            field_id = self.subforms_json_by_sf_name[subform_name][field_name]
-            field_def = dict(self.subforms_json_by_sf_name[subform_name][field_id])
-            field_def["Value"] = value
-            transformed_json[field_id] = field_def
-
-        headers = dict(self._headers)
-        headers["X-Http-Method-Override"] = "POST"
+            field_id = subform_fields[field_name]
+            transformed_json[field_id] = {
+                "Type": field_types[field_id],
+                "FieldId": field_id,
+                "Value": value,
+            }
 
         body = {
             "Content": {
@@ -731,18 +1120,19 @@ class ArcherInstance:
         }
 
         try:
-            response = await self._client.post(api_url, headers=headers, json=body)
+            response = await client.post(api_url, headers=self._OVERRIDE_POST, content=_dumps(body))
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             result_id = data["RequestedObject"]["Id"]
-            log.info(f"Subrecord created: {result_id}")
+            log.info("Subrecord created: %s", result_id)
             return result_id
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to create subrecord: {e}")
+            log.error("Failed to create subrecord: %s", e)
             raise ArcherAPIError(f"Failed to create subrecord: {e}") from e
 
+    @_retry
     async def delete_record(self, record_id: int) -> None:
         """
         Delete a content record.
@@ -750,11 +1140,8 @@ class ArcherInstance:
         Args:
             record_id: Record ID to delete
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/{record_id}"
-
-        headers = dict(self._headers)
-        headers["X-Http-Method-Override"] = "DELETE"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_content + str(record_id)
 
         body = {
             "Content": {
@@ -764,14 +1151,18 @@ class ArcherInstance:
         }
 
         try:
-            response = await self._client.delete(api_url, headers=headers, json=body)
+            # AsyncClient.delete() takes no body; use request() to send one
+            response = await client.request(
+                "DELETE", api_url, headers=self._OVERRIDE_DELETE, content=_dumps(body)
+            )
             response.raise_for_status()
-            log.info(f"Record deleted: {record_id}")
+            log.info("Record deleted: %s", record_id)
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to delete record {record_id}: {e}")
+            log.error("Failed to delete record %s: %s", record_id, e)
             raise ArcherAPIError(f"Failed to delete record: {e}") from e
 
+    @_retry_connect
     async def post_attachment(self, name: str, base64_string: str) -> int:
         """
         Upload an attachment.
@@ -783,11 +1174,8 @@ class ArcherInstance:
         Returns:
             Attachment ID
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/attachment"
-
-        headers = dict(self._headers)
-        headers["X-Http-Method-Override"] = "POST"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_attachment
 
         body = {
             "AttachmentName": name,
@@ -795,16 +1183,64 @@ class ArcherInstance:
         }
 
         try:
-            response = await self._client.post(api_url, headers=headers, json=body)
+            response = await client.post(api_url, headers=self._OVERRIDE_POST, content=_dumps(body))
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             attachment_id = data["RequestedObject"]["Id"]
-            log.info(f"Attachment posted: {attachment_id}")
+            log.info("Attachment posted: %s", attachment_id)
+            return attachment_id
+
+        except httpx.HTTPStatusError as e:
+            log.error("Failed to post attachment: %s", e)
+            raise ArcherAPIError(f"Failed to post attachment: {e}") from e
+
+    @_retry_connect
+    async def post_attachment_file(self, name: str, path: Path | str) -> int:
+        """
+        Upload a file as an attachment, base64-encoding it while it streams.
+        
+        Unlike post_attachment, the file is never held in memory as a whole;
+        peak memory stays around one chunk regardless of file size.
+        
+        Args:
+            name: Attachment name
+            path: Path of the file to upload
+            
+        Returns:
+            Attachment ID
+        """
+        client = self._client or await self._ensure_client()
+        api_url = self._url_attachment
+
+        path = Path(path)
+        prefix = b'{"AttachmentName":' + orjson.dumps(name) + b',"AttachmentBytes":"'
+        suffix = b'"}'
+        encoded_size = 4 * ((path.stat().st_size + 2) // 3)
+
+        headers = {
+            **self._OVERRIDE_POST,
+            "Content-Length": str(len(prefix) + encoded_size + len(suffix)),
+        }
+
+        async def body():
+            yield prefix
+            with path.open("rb") as f:
+                while chunk := await asyncio.to_thread(f.read, _ATTACHMENT_CHUNK_SIZE):
+                    yield base64.b64encode(chunk)
+            yield suffix
+
+        try:
+            response = await client.post(api_url, headers=headers, content=body())
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            attachment_id = data["RequestedObject"]["Id"]
+            log.info("Attachment posted: %s", attachment_id)
             return attachment_id
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to post attachment: {e}")
+            log.error("Failed to post attachment: %s", e)
             raise ArcherAPIError(f"Failed to post attachment: {e}") from e
 
     async def update_content_record(
@@ -834,31 +1270,54 @@ class ArcherInstance:
         Returns:
             Record object
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/fieldcontent/"
+        records = await self.get_records([record_id])
+        if not records:
+            raise RecordNotFoundError(f"Record {record_id} not found")
+        return records[0]
 
-        headers = dict(self._headers)
-        headers["X-Http-Method-Override"] = "POST"
+    async def get_records(
+        self,
+        record_ids: Sequence[int],
+        batch_size: int = 100
+    ) -> list[Record]:
+        """
+        Get multiple records, requesting up to batch_size IDs per call.
+        
+        Batches are fetched concurrently.
+        
+        Args:
+            record_ids: Internal Archer record IDs
+            batch_size: Maximum number of IDs per request
+            
+        Returns:
+            Record objects for the IDs that were found
+        """
+        client = self._client or await self._ensure_client()
+        api_url = self._url_fieldcontent
 
-        body = {
-            "FieldIds": self.all_application_fields_array,
-            "ContentIds": [str(record_id)]
-        }
+        prefix = self._field_ids_prefix or _field_ids_prefix(self.all_application_fields_array)
 
-        try:
-            response = await self._client.post(api_url, headers=headers, json=body)
+        @_retry
+        async def fetch_batch(batch: Sequence[int]) -> list[dict[str, Any]]:
+            body = _fieldcontent_body(prefix, batch)
+            response = await client.post(api_url, headers=self._OVERRIDE_POST, content=body)
             response.raise_for_status()
-            data = response.json()
-
-            if not data:
-                raise RecordNotFoundError(f"Record {record_id} not found")
+            return orjson.loads(response.content)
 
-            return Record(self, data[0]["RequestedObject"])
+        batches = [
+            record_ids[i:i + batch_size]
+            for i in range(0, len(record_ids), batch_size)
+        ]
 
+        try:
+            results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get record {record_id}: {e}")
-            raise ArcherAPIError(f"Failed to retrieve record: {e}") from e
+            log.error("Failed to get records: %s", e)
+            raise ArcherAPIError(f"Failed to retrieve records: {e}") from e
 
+        return [Record(self, item["RequestedObject"]) for data in results for item in data]
+
+    @_retry
     async def get_sub_record(self, sub_record_id: int, sub_record_name: str) -> Record:
         """
         Get a subform record.
@@ -870,23 +1329,21 @@ class ArcherInstance:
         Returns:
             Record object
         """
-        await self._ensure_client()
-        api_url = f"{self.api_url_base}core/content/fieldcontent/"
+        client = self._client or await self._ensure_client()
+        api_url = self._url_fieldcontent
 
-        all_fields = self.subforms_json_by_sf_name[sub_record_name]["AllFields"]
+        prefix = self._subform_field_ids_prefix.get(sub_record_name)
+        if prefix is None:
+            prefix = _field_ids_prefix(
+                self.subforms_json_by_sf_name[sub_record_name]["AllFields"]
+            )
 
-        headers = dict(self._headers)
-        headers["X-Http-Method-Override"] = "POST"
-
-        body = {
-            "FieldIds": all_fields,
-            "ContentIds": [str(sub_record_id)]
-        }
+        body = _fieldcontent_body(prefix, [sub_record_id])
 
         try:
-            response = await self._client.post(api_url, headers=headers, json=body)
+            response = await client.post(api_url, headers=self._OVERRIDE_POST, content=body)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data:
                 raise RecordNotFoundError(f"Subrecord {sub_record_id} not found")
@@ -894,7 +1351,7 @@ class ArcherInstance:
             return Record(self, data[0]["RequestedObject"])
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get subrecord {sub_record_id}: {e}")
+            log.error("Failed to get subrecord %s: %s", sub_record_id, e)
             raise ArcherAPIError(f"Failed to retrieve subrecord: {e}") from e
 
     # GRC API Methods (Content API)
@@ -909,15 +1366,9 @@ class ArcherInstance:
         Returns:
             List of matching endpoint URLs
         """
-        await self._ensure_client()
 
         try:
-            response = await self._client.get(
-                self.content_api_url_base,
-                headers=self._headers
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_metadata(self.content_api_url_base)
 
             matches = [
                 endpoint["url"]
@@ -926,20 +1377,30 @@ class ArcherInstance:
             ]
 
             if matches:
-                log.info(f"Found {len(matches)} matching endpoints")
+                log.info("Found %d matching endpoints", len(matches))
             else:
-                log.warning(f"No endpoints found matching '{app_name}'")
+                log.warning("No endpoints found matching '%s'", app_name)
 
             return matches
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to find GRC endpoints: {e}")
+            log.error("Failed to find GRC endpoints: %s", e)
             raise ArcherAPIError(f"Failed to find GRC endpoints: {e}") from e
 
+    @_retry_grc
+    async def _grc_get(self, api_url: str) -> httpx.Response:
+        """GET a GRC API URL under the instance-wide concurrency limit"""
+        client = self._client or await self._ensure_client()
+        async with self._grc_semaphore:
+            response = await client.get(api_url)
+        response.raise_for_status()
+        return response
+
     async def get_grc_endpoint_records(
         self,
         endpoint_url: str,
-        skip: int | None = None
+        skip: int | None = None,
+        select: Sequence[str] | None = None
     ) -> list[dict[str, Any]]:
         """
         Get records from GRC API endpoint (max 1000 per call).
@@ -947,78 +1408,147 @@ class ArcherInstance:
         Args:
             endpoint_url: Endpoint URL from find_grc_endpoint_url()
             skip: Number of records to skip
+            select: Fields to return; all fields when None
             
         Returns:
             List of record dicts
         """
-        await self._ensure_client()
-        
-        api_url = f"{self.content_api_url_base}{endpoint_url}"
+        query = []
         if skip is not None:
-            api_url += f"?$skip={skip}"
+            query.append(f"$skip={skip}")
+        if select:
+            query.append(f"$select={','.join(select)}")
+
+        api_url = f"{self.content_api_url_base}{endpoint_url}"
+        if query:
+            api_url += "?" + "&".join(query)
 
         try:
-            response = await self._client.get(api_url, headers=self._headers)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._grc_get(api_url)
 
-            return data["value"]
+            return orjson.loads(response.content)["value"]
 
         except httpx.HTTPStatusError as e:
-            log.error(f"Failed to get GRC records: {e}")
+            log.error("Failed to get GRC records: %s", e)
             raise ArcherAPIError(f"Failed to retrieve GRC records: {e}") from e
 
+    async def get_grc_endpoint_count(self, endpoint_url: str) -> int | None:
+        """
+        Get the number of records behind a GRC API endpoint.
+        
+        Args:
+            endpoint_url: Endpoint URL from find_grc_endpoint_url()
+            
+        Returns:
+            Record count, or None if the endpoint doesn't support $count
+        """
+        api_url = f"{self.content_api_url_base}{endpoint_url}?$top=1&$count=true"
+
+        try:
+            response = await self._grc_get(api_url)
+
+            return orjson.loads(response.content).get("@odata.count")
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in _COUNT_UNSUPPORTED_STATUS:
+                log.debug("Endpoint %s does not report a record count", endpoint_url)
+                return None
+            log.error("Failed to get GRC record count: %s", e)
+            raise ArcherAPIError(f"Failed to retrieve GRC record count: {e}") from e
+
     async def build_unique_value_to_id_mapping(
         self,
         endpoint_url: str,
         key_value_field: str,
         prefix: str = "",
-        max_records: int = 22000
+        max_records: int = 22000,
+        concurrency: int = 16
     ) -> dict[str, int]:
         """
         Build mapping of unique field values to record IDs.
         
+        The record count is requested first so every page up to max_records
+        can be fetched concurrently. Endpoints that don't report a count are
+        probed with the first page instead, and if it is full the remaining
+        pages are fetched concurrently. Pages are consumed in order and
+        requests for pages past the first short one are cancelled.
+        
+        With cache_dir set, the result is persisted and reused for
+        mapping_ttl seconds without contacting the GRC API. Records added
+        afterwards with the same prefix are written back to it on close().
+        
         Args:
             endpoint_url: Endpoint URL
             key_value_field: Name of field with unique values
             prefix: Optional prefix to add to field values
             max_records: Maximum records to retrieve
+            concurrency: Maximum number of page requests in flight
             
         Returns:
             Dict mapping field values to content IDs
         """
-        all_records = []
-        skip = 0
-        consecutive_full_batches = 0
-
-        while skip < max_records:
-            batch = await self.get_grc_endpoint_records(endpoint_url, skip)
-            
-            if not batch:
-                break
-
-            all_records.extend(batch)
-
-            if len(batch) == 1000:
-                consecutive_full_batches += 1
-                if consecutive_full_batches > 21:
-                    log.warning("Max batch limit reached, consider increasing max_records")
-                    break
-            else:
-                break
-
-            skip += 1000
-
-        # Build mapping
-        for record in all_records:
-            if key_value_field in record:
-                field_value = f"{prefix}{record[key_value_field]}"
-                system_id = record[f"{endpoint_url}_Id"]
-                self.key_field_value_to_system_id[field_value] = system_id
-
-        log.info(
-            f"Built mapping with {len(self.key_field_value_to_system_id)} records"
-        )
+        cache_path = self._mapping_path(endpoint_url, key_value_field, prefix, max_records)
+        cached = self._load_mapping(cache_path, prefix)
+        if cached is not None:
+            self.key_field_value_to_system_id.update(cached)
+            log.info("Loaded mapping with %d records from %s", len(cached), cache_path)
+            return self.key_field_value_to_system_id
+
+        page_size = 1000
+        mapping: dict[str, int] = {}
+        # Interned so each per-record lookup hits the dict's identity fast path
+        id_key = sys.intern(f"{endpoint_url}_Id")
+        # Only these two fields are read, so have the server project the rest out
+        select = (key_value_field, id_key)
+
+        count = await self.get_grc_endpoint_count(endpoint_url)
+        if count is None:
+            batch = await self.get_grc_endpoint_records(endpoint_url, 0, select)
+            _fold_records(batch, key_value_field, id_key, prefix, mapping)
+            first_skip = page_size
+            more = len(batch) == page_size
+        else:
+            if count > max_records:
+                log.warning("Max batch limit reached, consider increasing max_records")
+            first_skip = 0
+            more = True
+        end = max_records if count is None else min(count, max_records)
+
+        if more and first_skip < end:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch_page(skip: int) -> list[dict[str, Any]]:
+                async with semaphore:
+                    return await self.get_grc_endpoint_records(endpoint_url, skip, select)
+
+            tasks = deque(
+                asyncio.create_task(fetch_page(skip))
+                for skip in range(first_skip, end, page_size)
+            )
+            try:
+                # Later pages keep downloading while earlier ones are consumed;
+                # consumed tasks are dropped so their pages can be freed
+                while tasks:
+                    batch = await tasks.popleft()
+                    # Fold each page in as it arrives so only the pages in flight
+                    # are alive at a time
+                    _fold_records(batch, key_value_field, id_key, prefix, mapping)
+                    if len(batch) < page_size:
+                        break
+                else:
+                    if count is None:
+                        log.warning("Max batch limit reached, consider increasing max_records")
+            finally:
+                # Pages past the end of the data (or left over after an error)
+                # are not needed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.key_field_value_to_system_id.update(mapping)
+        self._save_mapping(cache_path, mapping, prefix)
+
+        log.info("Built mapping with %d records", len(self.key_field_value_to_system_id))
         return self.key_field_value_to_system_id
 
     def get_record_id_by_unique_value(self, key_value: str) -> int:
@@ -1034,11 +1564,12 @@ class ArcherInstance:
         Raises:
             RecordNotFoundError: If value not found
         """
-        if key_value not in self.key_field_value_to_system_id:
+        system_id = self.key_field_value_to_system_id.get(key_value)
+        if system_id is None:
             raise RecordNotFoundError(
                 f"No record found with key value '{key_value}'"
             )
-        return self.key_field_value_to_system_id[key_value]
+        return system_id
 
     def add_record_id_to_mapping(
         self,
@@ -1049,11 +1580,40 @@ class ArcherInstance:
         """
         Add a record to the unique value mapping.
         
+        The persisted mapping built with the same prefix, if any, is
+        re-saved with it on close().
+        
         Args:
             key_value: Unique field value
             system_id: Record ID
             prefix: Optional prefix
         """
-        field_value = f"{prefix}{key_value}"
+        field_value = sys.intern(prefix + str(key_value) if prefix else str(key_value))
         self.key_field_value_to_system_id[field_value] = system_id
-        log.debug(f"Added mapping: {field_value} -> {system_id}")
+        self._track_added_records({field_value: system_id}, prefix)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Added mapping: %s -> %s", field_value, system_id)
+
+    def add_record_ids_to_mapping(
+        self,
+        pairs: Iterable[tuple[str, int]],
+        prefix: str = ""
+    ) -> None:
+        """
+        Add many records to the unique value mapping at once.
+        
+        The persisted mapping built with the same prefix, if any, is
+        re-saved once with all of them.
+        
+        Args:
+            pairs: (unique field value, record ID) pairs
+            prefix: Optional prefix added to every field value
+        """
+        intern = sys.intern
+        if prefix:
+            added = {intern(prefix + str(key_value)): system_id for key_value, system_id in pairs}
+        else:
+            added = {intern(str(key_value)): system_id for key_value, system_id in pairs}
+        self.key_field_value_to_system_id.update(added)
+        self._track_added_records(added, prefix)
+        self._flush_mappings()
@@ -0,0 +1,285 @@
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import RedisError
+from agents import base_agent
+from agents.base_agent import BaseAgent, _cache_get, _cache_set, _llm_slot
+from agents.batcher import LLMBatcher
+from agents.errors import LLMOverloadedError
+from agents.gencache import GenCache
+
+class StubClient:
+    """Stands in for openai.AsyncOpenAI; records each chat completion request"""
+
+    def __init__(self, content="ok", delay=0, error=None):
+        self.content = content
+        self.delay = delay
+        self.error = error
+        self.requests = []
+        self.chat = SimpleNamespace(completions=self)
+
+    async def create(self, **request):
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=SimpleNamespace())
+
+class StubRedis:
+    """Stands in for redis.asyncio.Redis; raises ``error`` from every call"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.data = {}
+
+    async def get(self, key):
+        if self.error is not None:
+            raise self.error
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.error is not None:
+            raise self.error
+        self.data[key] = value
+
+class EchoAgent(BaseAgent):
+    __slots__ = ()
+
+    async def process(self, input_data):
+        return {"content": await self.call_llm(input_data["task"])}
+
+def request(prompt, temperature=0):
+    return {"model": "gpt-4o", "messages": [{"role": "user", "content": prompt}], "temperature": temperature}
+
+@pytest.fixture
+def llm_state(monkeypatch):
+    """Fresh module-level LLM cache/limits; call with settings overrides"""
+    monkeypatch.setattr(base_agent, "_llm_cache", OrderedDict())
+    monkeypatch.setattr(base_agent, "_redis", None)
+    monkeypatch.setattr(base_agent, "_batcher", None)
+    monkeypatch.setattr(base_agent, "_llm_semaphore", None)
+    monkeypatch.setattr(base_agent, "_llm_waiting", 0)
+    def configure(**overrides):
+        monkeypatch.setattr(base_agent, "settings", base_agent.settings.model_copy(update=overrides))
+    return configure
+
+def test_batcher_dispatches_queued_requests():
+    async def run():
+        client = StubClient()
+        batcher = LLMBatcher(client, max_wait=0.05)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(request(p)) for p in "abc"))
+        await batcher.stop()
+        return client, results
+
+    client, results = asyncio.run(run())
+    assert [r.choices[0].message.content for r in results] == ["ok"] * 3
+    assert sorted(r["messages"][0]["content"] for r in client.requests) == ["a", "b", "c"]
+
+def test_batcher_flushes_at_deadline():
+    async def run():
+        batcher = LLMBatcher(StubClient(), max_wait=0.01, batch_size=16)
+        batcher.start()
+        try:
+            return await asyncio.wait_for(batcher.submit(request("a")), 1)
+        finally:
+            await batcher.stop()
+
+    assert asyncio.run(run()).choices[0].message.content == "ok"
+
+def test_batcher_flushes_full_batch_before_deadline():
+    async def run():
+        batcher = LLMBatcher(StubClient(), max_wait=10, batch_size=2)
+        batcher.start()
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(batcher.submit(request("a")), batcher.submit(request("b"))), 1
+            )
+        finally:
+            await batcher.stop()
+
+    assert len(asyncio.run(run())) == 2
+
+def test_batcher_merges_only_shareable_requests():
+    async def run(shareable):
+        client = StubClient()
+        batcher = LLMBatcher(client, max_wait=0.05)
+        batcher.start()
+        await asyncio.gather(*(batcher.submit(request("a", 0.7), shareable=shareable) for _ in range(3)))
+        await batcher.stop()
+        return len(client.requests)
+
+    assert asyncio.run(run(shareable=True)) == 1
+    assert asyncio.run(run(shareable=False)) == 3
+
+def test_batcher_propagates_errors():
+    async def run():
+        batcher = LLMBatcher(StubClient(error=ValueError("boom")), max_wait=0.01)
+        batcher.start()
+        try:
+            await batcher.submit(request("a"))
+        finally:
+            await batcher.stop()
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+def test_batcher_survives_cancelled_caller():
+    async def run():
+        batcher = LLMBatcher(StubClient(delay=0.05), max_wait=0.01)
+        batcher.start()
+        cancelled = asyncio.create_task(batcher.submit(request("a"), shareable=True))
+        kept = asyncio.create_task(batcher.submit(request("a"), shareable=True))
+        await asyncio.sleep(0.02)
+        cancelled.cancel()
+        result = await kept
+        await batcher.stop()
+        return cancelled, result
+
+    cancelled, result = asyncio.run(run())
+    assert cancelled.cancelled()
+    assert result.choices[0].message.content == "ok"
+
+def test_batcher_stop_fails_collected_and_queued_requests():
+    async def run():
+        batcher = LLMBatcher(StubClient(), max_wait=10, batch_size=16)
+        batcher.start()
+        collected = asyncio.create_task(batcher.submit(request("a")))
+        await asyncio.sleep(0.01)
+        # Queued behind the worker without it getting a chance to collect them
+        queued = [asyncio.get_running_loop().create_future() for _ in range(2)]
+        for future in queued:
+            batcher._queue.put_nowait((request("b"), False, future))
+        await batcher.stop()
+        return await asyncio.gather(collected, *queued, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+def test_batcher_submit_requires_start():
+    with pytest.raises(RuntimeError):
+        asyncio.run(LLMBatcher(StubClient()).submit(request("a")))
+
+def test_llm_slot_overload_threshold(llm_state):
+    llm_state(MAX_CONCURRENT_LLM=1, LLM_MAX_WAITERS=1)
+
+    async def run():
+        release = asyncio.Event()
+
+        async def hold():
+            async with _llm_slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(LLMOverloadedError):
+            async with _llm_slot():
+                pass
+        release.set()
+        await asyncio.gather(holder, waiter)
+        # Below the threshold again, so callers queue for a slot
+        async with _llm_slot():
+            pass
+
+    asyncio.run(run())
+
+def test_cache_lru_eviction(llm_state):
+    llm_state(LLM_CACHE_SIZE=2)
+
+    async def run():
+        await _cache_set("a", "1")
+        await _cache_set("b", "2")
+        await _cache_get("a")
+        await _cache_set("c", "3")
+        return [await _cache_get(key) for key in "abc"]
+
+    assert asyncio.run(run()) == ["1", None, "3"]
+
+def test_cache_reads_through_redis(llm_state, monkeypatch):
+    llm_state()
+    redis = StubRedis()
+    redis.data["llm:a"] = "1"
+    monkeypatch.setattr(base_agent, "_redis", redis)
+
+    assert asyncio.run(_cache_get("a")) == "1"
+    assert base_agent._llm_cache["a"] == "1"
+
+def test_cache_redis_errors_are_misses(llm_state, monkeypatch):
+    llm_state()
+    monkeypatch.setattr(base_agent, "_redis", StubRedis(error=RedisError("down")))
+
+    async def run():
+        missing = await _cache_get("a")
+        await _cache_set("b", "2")
+        return missing, await _cache_get("b")
+
+    assert asyncio.run(run()) == (None, "2")
+
+def test_call_llm_caches_only_deterministic_calls(llm_state):
+    llm_state(GENCACHE_ENABLED=False, SEMANTIC_CACHE_ENABLED=False)
+    client = StubClient()
+    agent = EchoAgent("echo", client=client)
+
+    async def run():
+        for _ in range(2):
+            await agent.call_llm("plan", temperature=0)
+        for _ in range(2):
+            await agent.call_llm("plan", temperature=0.7)
+        await agent.call_llm("plan", temperature=0.7, cache=True)
+        await agent.call_llm("plan", temperature=0.7, cache=True)
+
+    asyncio.run(run())
+    assert len(client.requests) == 4
+
+def test_gencache_serves_confirmed_template():
+    cache = GenCache(min_confirmations=2, verify_rate=0)
+    cache.store("s", 'Greet "Bob"', "Hello, Bob!")
+    assert cache.lookup("s", 'Greet "Eve"') is None
+    cache.store("s", 'Greet "Ann"', "Hello, Ann!")
+    assert cache.lookup("s", 'Greet "Eve"') == "Hello, Eve!"
+    assert cache.lookup("other", 'Greet "Eve"') is None
+
+def test_gencache_ignores_repeated_slot_values():
+    cache = GenCache(min_confirmations=2, verify_rate=0)
+    cache.store("s", 'Greet "Bob"', "Hello, Bob!")
+    cache.store("s", 'Greet "Bob"', "Hello, Bob!")
+    assert cache.lookup("s", 'Greet "Eve"') is None
+
+def test_gencache_never_serves_constant_responses():
+    cache = GenCache(min_confirmations=2, verify_rate=0)
+    cache.store("s", "Is 7 prime?", "Yes")
+    cache.store("s", "Is 11 prime?", "Yes")
+    assert cache.lookup("s", "Is 12 prime?") is None
+
+def test_gencache_matches_slots_as_whole_tokens():
+    cache = GenCache(min_confirmations=2, verify_rate=0)
+    cache.store("s", "Add 1 item", "Added 1 of 10 items, 1.5 kg")
+    cache.store("s", "Add 2 item", "Added 2 of 10 items, 1.5 kg")
+    assert cache.lookup("s", "Add 3 item") == "Added 3 of 10 items, 1.5 kg"
+
+def test_gencache_resets_on_mismatch():
+    cache = GenCache(min_confirmations=2, verify_rate=0)
+    cache.store("s", 'Greet "Bob"', "Hello, Bob!")
+    cache.store("s", 'Greet "Ann"', "Hello, Ann!")
+    cache.store("s", 'Greet "Joe"', "Hi there, Joe.")
+    assert cache.lookup("s", 'Greet "Eve"') is None
+
+def test_gencache_verifies_sampled_hits():
+    cache = GenCache(min_confirmations=2, verify_rate=1)
+    cache.store("s", 'Greet "Bob"', "Hello, Bob!")
+    cache.store("s", 'Greet "Ann"', "Hello, Ann!")
+    assert cache.lookup("s", 'Greet "Eve"') is None
+
+def test_gencache_evicts_least_recent_cluster():
+    cache = GenCache(max_clusters=1, min_confirmations=1, verify_rate=0)
+    cache.store("a", 'Greet "Bob"', "Hello, Bob!")
+    cache.store("b", 'Greet "Bob"', "Hello, Bob!")
+    assert cache.lookup("a", 'Greet "Eve"') is None
+    assert cache.lookup("b", 'Greet "Eve"') == "Hello, Eve!"
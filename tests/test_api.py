@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from backend.main import app
+from agents.errors import LLMOverloadedError
 
 client = TestClient(app)
 
@@ -13,3 +16,69 @@ def test_health():
     response = client.get("/api/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
+
+class StubAgent:
+    """Stands in for TaskAgent; raises ``error`` after yielding ``chunks``"""
+
+    def __init__(self, chunks=(), error=None, result=None):
+        self.chunks = chunks
+        self.error = error
+        self.result = result or {}
+
+    async def process(self, input_data):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def stream_process(self, input_data):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+@pytest.fixture
+def stub_agent():
+    previous = getattr(app.state, "task_agent", None)
+    def install(**kwargs):
+        app.state.task_agent = StubAgent(**kwargs)
+    yield install
+    app.state.task_agent = previous
+
+def test_process(stub_agent):
+    stub_agent(result={"answer": 42})
+    response = client.post("/api/process", json={"task": "plan"})
+    assert response.status_code == 200
+    assert response.json()["result"] == {"answer": 42}
+
+def test_process_overloaded(stub_agent):
+    stub_agent(error=LLMOverloadedError("Too many concurrent LLM requests"))
+    response = client.post("/api/process", json={"task": "plan"})
+    assert response.status_code == 429
+
+def test_process_timeout(stub_agent):
+    stub_agent(error=asyncio.TimeoutError())
+    response = client.post("/api/process", json={"task": "plan"})
+    assert response.status_code == 504
+
+def test_process_stream(stub_agent):
+    stub_agent(chunks=["Hello", " world"])
+    response = client.post("/api/process/stream", json={"task": "plan"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'data: "Hello"\n\ndata: " world"\n\ndata: [DONE]\n\n'
+
+def test_process_stream_overloaded(stub_agent):
+    stub_agent(error=LLMOverloadedError("Too many concurrent LLM requests"))
+    response = client.post("/api/process/stream", json={"task": "plan"})
+    assert response.status_code == 429
+
+def test_process_stream_timeout(stub_agent):
+    stub_agent(error=asyncio.TimeoutError())
+    response = client.post("/api/process/stream", json={"task": "plan"})
+    assert response.status_code == 504
+
+def test_process_stream_error_after_first_chunk(stub_agent):
+    stub_agent(chunks=["partial"], error=RuntimeError("boom"))
+    response = client.post("/api/process/stream", json={"task": "plan"})
+    assert response.status_code == 200
+    assert response.text == 'data: "partial"\n\nevent: error\ndata: "boom"\n\n'